@@ -1,9 +1,21 @@
 
 # backend/app/__init__.py
-from flask import Flask
+from flask import Flask, Response
 from flask_cors import CORS
-from app.api.correlations import correlations_bp
+from app.api import api_bp
 import logging
+import orjson
+
+# The landing payload never changes, so serialize it once at import
+_INDEX_BODY = orjson.dumps({
+    'message': 'FTRT-Cambrian Correlation Project API',
+    'version': '1.0.0',
+    'endpoints': [
+        '/api/correlations',
+        '/api/cosmic-events',
+        '/api/evolutionary-events'
+    ]
+})
 
 def create_app(config_name='development'):
     app = Flask(__name__)
@@ -18,7 +30,7 @@ def create_app(config_name='development'):
     CORS(app)
     
     # Registrar blueprints
-    app.register_blueprint(correlations_bp)
+    app.register_blueprint(api_bp, url_prefix='/api')
     
     # Configurar logging
     logging.basicConfig(
@@ -28,14 +40,6 @@ def create_app(config_name='development'):
     
     @app.route('/')
     def index():
-        return {
-            'message': 'FTRT-Cambrian Correlation Project API',
-            'version': '1.0.0',
-            'endpoints': [
-                '/api/correlations',
-                '/api/cosmic-events',
-                '/api/evolutionary-events'
-            ]
-        }
-    
+        return Response(_INDEX_BODY, mimetype='application/json')
+
     return app
@@ -0,0 +1,79 @@
+"""Shared response serialization and caching helpers for the API routes."""
+
+from flask import Response, request, stream_with_context
+from datetime import datetime
+import gzip
+import hashlib
+import msgpack
+import numpy as np
+import orjson
+from cachetools import TTLCache
+
+# Cache expensive analysis results so repeated/polled queries are ~O(1).
+# Shared across the route modules; their key tuples carry a distinguishing
+# prefix or shape, so entries cannot collide
+_cache = TTLCache(maxsize=256, ttl=300)
+
+def _cached(key, fn):
+    """Return the cached value for key, computing and storing it on a miss"""
+    result = _cache.get(key)
+    if result is None:
+        result = fn()
+        _cache[key] = result
+    return result
+
+# Cluster dicts are keyed by integer cluster id, hence OPT_NON_STR_KEYS;
+# events are dataclasses that the route-local defaults shape, hence
+# OPT_PASSTHROUGH_DATACLASS
+_OPTS = (orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+         | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+def _json(payload, status=200, default=None):
+    """Serialize a response payload with orjson's C encoder"""
+    return Response(orjson.dumps(payload, default=default or _json_default, option=_OPTS),
+                    status=status, mimetype='application/json')
+
+def _json_default(obj):
+    # pandas Timestamps subclass datetime, which orjson only serializes exactly
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    # numpy scalars reach here only on the msgpack path
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError
+
+# Compressed bodies are memoized by content digest so cache hits skip gzip
+_gzip_cache = TTLCache(maxsize=128, ttl=300)
+
+def compress_response(resp):
+    """Gzip a response for clients that accept it, reusing cached compressions"""
+    if 'gzip' not in (request.headers.get('Accept-Encoding') or ''):
+        return resp
+    body = resp.get_data()
+    if len(body) < 1024:
+        # Too small for compression to pay for itself
+        return resp
+    key = hashlib.sha1(body).digest()
+    compressed = _gzip_cache.get(key)
+    if compressed is None:
+        compressed = gzip.compress(body, compresslevel=6)
+        _gzip_cache[key] = compressed
+    resp.set_data(compressed)
+    resp.headers['Content-Encoding'] = 'gzip'
+    resp.headers['Vary'] = 'Accept-Encoding'
+    return resp
+
+def _respond(payload, default=None):
+    """Content-negotiate the response encoding (JSON default, MessagePack opt-in)"""
+    best = request.accept_mimetypes.best_match(['application/json', 'application/msgpack'])
+    if best == 'application/msgpack':
+        return compress_response(Response(msgpack.packb(payload, default=default or _json_default),
+                                          mimetype='application/msgpack'))
+    return compress_response(_json(payload, default=default))
+
+def _ndjson(events, default):
+    """Stream events one serialized line at a time instead of buffering the array"""
+    def gen():
+        for event in events:
+            yield orjson.dumps(default(event), default=_json_default, option=_OPTS) + b'\n'
+    return Response(stream_with_context(gen()), mimetype='application/x-ndjson')
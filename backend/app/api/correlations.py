@@ -1,13 +1,46 @@
-from flask import jsonify, request
+from flask import request
 from app.api import api_bp
+from app.api._serialization import _cached, _json, _respond
 from app.core.cosmic_evolution_correlator import CosmicEvolutionCorrelator
-from datetime import datetime
+from datetime import datetime, timezone
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Initialize the correlator
-correlator = CosmicEvolutionCorrelator()
+@functools.lru_cache(maxsize=1)
+def get_correlator():
+    """Build the shared correlator on first use instead of at worker import"""
+    return CosmicEvolutionCorrelator()
+
+# Shared default for open-ended start ranges, built once per process
+_DEFAULT_START = datetime(2000, 1, 1)
+
+def _parse_iso(s, default):
+    """Parse an ISO-8601 date string on the C fast path, tolerating a trailing 'Z'"""
+    if not s:
+        return default
+    parsed = datetime.fromisoformat(s.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        # Internal series use naive UTC timestamps
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def _parse_or_400(s, default):
+    """Parse a date parameter, returning (value, None) or (None, 400 response)"""
+    try:
+        return _parse_iso(s, default), None
+    except ValueError:
+        return None, _json({'success': False, 'error': f"Invalid date: {s}"}, 400)
+
+def parse_date_range():
+    """Resolve the start/end date query parameters for any endpoint in one place"""
+    g = request.args.get
+    start, error = _parse_or_400(g('start_date'), _DEFAULT_START)
+    if error is not None:
+        return None, None, error
+    end, error = _parse_or_400(g('end_date'), datetime.now().replace(second=0, microsecond=0))
+    return start, end, error
 
 @api_bp.route('/correlations', methods=['GET'])
 def get_correlations():
@@ -19,38 +52,41 @@ def get_correlations():
     - max_lag_days: Maximum time lag in days to consider (default: 365)
     """
     try:
+        correlator = get_correlator()
+
         # Get query parameters
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
         max_lag_days = int(request.args.get('max_lag_days', 365))
         
-        # Set default dates if not provided
-        if not start_date_str:
-            start_date = datetime(2000, 1, 1)
-        else:
-            start_date = datetime.fromisoformat(start_date_str)
-            
-        if not end_date_str:
-            end_date = datetime.now()
-        else:
-            end_date = datetime.fromisoformat(end_date_str)
+        # Reject malformed dates with a 400 before any expensive work
+        start_date, end_date, error = parse_date_range()
+        if error is not None:
+            return error
         
         # Perform correlation analysis
-        results = correlator.correlate_events(start_date, end_date, max_lag_days)
+        results = _cached(
+            (start_date, end_date, max_lag_days),
+            lambda: correlator.correlate_events(start_date, end_date, max_lag_days)
+        )
         
-        return jsonify({
+        return _respond({
             'success': True,
             'data': results,
             'message': f"Correlation analysis completed for period {start_date} to {end_date}"
         })
     
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e),
+            'message': "Failed to complete correlation analysis"
+        }, 400)
     except Exception as e:
-        logger.error(f"Error in correlation analysis: {str(e)}")
-        return jsonify({
+        logger.exception("Error in correlation analysis")
+        return _json({
             'success': False,
             'error': str(e),
             'message': "Failed to complete correlation analysis"
-        }), 500
+        }, 500)
 
 @api_bp.route('/correlations/summary', methods=['GET'])
 def get_correlation_summary():
@@ -58,24 +94,21 @@ def get_correlation_summary():
     Endpoint to get a summary of correlation results
     """
     try:
+        correlator = get_correlator()
+
         # Get query parameters
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
         max_lag_days = int(request.args.get('max_lag_days', 365))
         
-        # Set default dates if not provided
-        if not start_date_str:
-            start_date = datetime(2000, 1, 1)
-        else:
-            start_date = datetime.fromisoformat(start_date_str)
-            
-        if not end_date_str:
-            end_date = datetime.now()
-        else:
-            end_date = datetime.fromisoformat(end_date_str)
+        # Reject malformed dates with a 400 before any expensive work
+        start_date, end_date, error = parse_date_range()
+        if error is not None:
+            return error
         
         # Perform correlation analysis
-        results = correlator.correlate_events(start_date, end_date, max_lag_days)
+        results = _cached(
+            (start_date, end_date, max_lag_days),
+            lambda: correlator.correlate_events(start_date, end_date, max_lag_days)
+        )
         
         # Extract summary information
         summary = {
@@ -91,19 +124,25 @@ def get_correlation_summary():
             'evolutionary_clusters': len(results['evolutionary_clusters'])
         }
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': summary,
             'message': "Correlation summary generated successfully"
         })
     
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e),
+            'message': "Failed to generate correlation summary"
+        }, 400)
     except Exception as e:
-        logger.error(f"Error generating correlation summary: {str(e)}")
-        return jsonify({
+        logger.exception("Error generating correlation summary")
+        return _json({
             'success': False,
             'error': str(e),
             'message': "Failed to generate correlation summary"
-        }), 500
+        }, 500)
 
 @api_bp.route('/correlations/statistical-significance', methods=['GET'])
 def get_statistical_significance():
@@ -111,25 +150,22 @@ def get_statistical_significance():
     Endpoint to get statistical significance of correlations
     """
     try:
+        correlator = get_correlator()
+
         # Get query parameters
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
         max_lag_days = int(request.args.get('max_lag_days', 365))
         significance_threshold = float(request.args.get('significance_threshold', 0.05))
         
-        # Set default dates if not provided
-        if not start_date_str:
-            start_date = datetime(2000, 1, 1)
-        else:
-            start_date = datetime.fromisoformat(start_date_str)
-            
-        if not end_date_str:
-            end_date = datetime.now()
-        else:
-            end_date = datetime.fromisoformat(end_date_str)
+        # Reject malformed dates with a 400 before any expensive work
+        start_date, end_date, error = parse_date_range()
+        if error is not None:
+            return error
         
         # Perform correlation analysis
-        results = correlator.correlate_events(start_date, end_date, max_lag_days)
+        results = _cached(
+            (start_date, end_date, max_lag_days),
+            lambda: correlator.correlate_events(start_date, end_date, max_lag_days)
+        )
         
         # Filter for significant correlations
         significant_correlations = [
@@ -143,7 +179,7 @@ def get_statistical_significance():
             reverse=True
         )
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': {
                 'total_correlations': len(results['correlation_results']),
@@ -154,10 +190,16 @@ def get_statistical_significance():
             'message': f"Found {len(significant_correlations)} statistically significant correlations"
         })
     
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e),
+            'message': "Failed to analyze statistical significance"
+        }, 400)
     except Exception as e:
-        logger.error(f"Error analyzing statistical significance: {str(e)}")
-        return jsonify({
+        logger.exception("Error analyzing statistical significance")
+        return _json({
             'success': False,
             'error': str(e),
             'message': "Failed to analyze statistical significance"
-        }), 500
+        }, 500)
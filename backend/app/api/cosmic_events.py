@@ -1,13 +1,19 @@
-from flask import jsonify, request
+from flask import request
 from app.api import api_bp
-from app.core.cosmic_evolution_correlator import CosmicEvolutionCorrelator
-from datetime import datetime
+from app.api._serialization import _cached, _json, _json_default, _ndjson, _respond
+from app.api.correlations import get_correlator, parse_date_range
+from app.core.cosmic_evolution_correlator import CosmicEvent
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Initialize the correlator
-correlator = CosmicEvolutionCorrelator()
+def _event_default(obj):
+    """Shape a raw event for the JSON payload without an intermediate dict list"""
+    if isinstance(obj, CosmicEvent):
+        return {'timestamp': obj.timestamp, 'type': obj.event_type,
+                'magnitude': obj.magnitude, 'duration_days': obj.duration.days,
+                'description': obj.description}
+    return _json_default(obj)
 
 @api_bp.route('/cosmic-events', methods=['GET'])
 def get_cosmic_events():
@@ -19,58 +25,65 @@ def get_cosmic_events():
     - event_type: Type of event (ftrt, geomagnetic, all)
     """
     try:
+        correlator = get_correlator()
+
         # Get query parameters
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
         event_type = request.args.get('event_type', 'all')
         
-        # Set default dates if not provided
-        if not start_date_str:
-            start_date = datetime(2000, 1, 1)
-        else:
-            start_date = datetime.fromisoformat(start_date_str)
-            
-        if not end_date_str:
-            end_date = datetime.now()
-        else:
-            end_date = datetime.fromisoformat(end_date_str)
+        # Reject malformed dates with a 400 before any expensive work
+        start_date, end_date, error = parse_date_range()
+        if error is not None:
+            return error
         
         # Get cosmic events based on type
         if event_type == 'ftrt':
-            events = correlator.ftrt_calculator.find_peaks(start_date, end_date)
+            events = _cached(
+                ('ftrt', start_date, end_date, 1.5),
+                lambda: correlator.ftrt_calculator.find_peaks(start_date, end_date)
+            )
         elif event_type == 'geomagnetic':
-            events = correlator.paleomag_database.get_field_weaknesses(start_date, end_date)
+            events = _cached(
+                ('geomagnetic', start_date, end_date, 10.0),
+                lambda: correlator.paleomag_database.get_field_weaknesses(start_date, end_date)
+            )
         else:
             # Get all events
-            ftrt_peaks = correlator.ftrt_calculator.find_peaks(start_date, end_date)
-            geomag_minima = correlator.paleomag_database.get_field_weaknesses(start_date, end_date)
+            ftrt_peaks = _cached(
+                ('ftrt', start_date, end_date, 1.5),
+                lambda: correlator.ftrt_calculator.find_peaks(start_date, end_date)
+            )
+            geomag_minima = _cached(
+                ('geomagnetic', start_date, end_date, 10.0),
+                lambda: correlator.paleomag_database.get_field_weaknesses(start_date, end_date)
+            )
             events = ftrt_peaks + geomag_minima
         
-        # Format events for JSON response
-        formatted_events = []
-        for event in events:
-            formatted_events.append({
-                'timestamp': event.timestamp.isoformat(),
-                'type': event.event_type,
-                'magnitude': event.magnitude,
-                'duration_days': event.duration.days,
-                'description': event.description
-            })
-        
-        return jsonify({
+        # Stream one event per line when requested, keeping response memory flat
+        if request.args.get('stream') == '1':
+            return _ndjson(events, _event_default)
+
+        # Events are serialized in place via _event_default, with no
+        # intermediate dict list
+        return _respond({
             'success': True,
-            'data': formatted_events,
-            'count': len(formatted_events),
-            'message': f"Retrieved {len(formatted_events)} cosmic events"
-        })
+            'data': events,
+            'count': len(events),
+            'message': f"Retrieved {len(events)} cosmic events"
+        }, default=_event_default)
     
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e),
+            'message': "Failed to retrieve cosmic events"
+        }, 400)
     except Exception as e:
-        logger.error(f"Error retrieving cosmic events: {str(e)}")
-        return jsonify({
+        logger.exception("Error retrieving cosmic events")
+        return _json({
             'success': False,
             'error': str(e),
             'message': "Failed to retrieve cosmic events"
-        }), 500
+        }, 500)
 
 @api_bp.route('/cosmic-events/ftrt', methods=['GET'])
 def get_ftrt_peaks():
@@ -78,49 +91,52 @@ def get_ftrt_peaks():
     Endpoint specifically for FTRT peaks
     """
     try:
+        correlator = get_correlator()
+
         # Get query parameters
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
         threshold = float(request.args.get('threshold', 1.5))
         
-        # Set default dates if not provided
-        if not start_date_str:
-            start_date = datetime(2000, 1, 1)
-        else:
-            start_date = datetime.fromisoformat(start_date_str)
-            
-        if not end_date_str:
-            end_date = datetime.now()
-        else:
-            end_date = datetime.fromisoformat(end_date_str)
+        # Reject malformed dates with a 400 before any expensive work
+        start_date, end_date, error = parse_date_range()
+        if error is not None:
+            return error
         
         # Get FTRT peaks
-        events = correlator.ftrt_calculator.find_peaks(start_date, end_date, threshold)
+        events = _cached(
+            ('ftrt', start_date, end_date, threshold),
+            lambda: correlator.ftrt_calculator.find_peaks(start_date, end_date, threshold)
+        )
         
         # Format events for JSON response
         formatted_events = []
         for event in events:
             formatted_events.append({
-                'timestamp': event.timestamp.isoformat(),
+                'timestamp': event.timestamp,
                 'magnitude': event.magnitude,
                 'duration_days': event.duration.days,
                 'description': event.description
             })
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': formatted_events,
             'count': len(formatted_events),
             'message': f"Retrieved {len(formatted_events)} FTRT peaks"
         })
     
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e),
+            'message': "Failed to retrieve FTRT peaks"
+        }, 400)
     except Exception as e:
-        logger.error(f"Error retrieving FTRT peaks: {str(e)}")
-        return jsonify({
+        logger.exception("Error retrieving FTRT peaks")
+        return _json({
             'success': False,
             'error': str(e),
             'message': "Failed to retrieve FTRT peaks"
-        }), 500
+        }, 500)
 
 @api_bp.route('/cosmic-events/geomagnetic', methods=['GET'])
 def get_geomagnetic_events():
@@ -128,46 +144,49 @@ def get_geomagnetic_events():
     Endpoint specifically for geomagnetic events
     """
     try:
+        correlator = get_correlator()
+
         # Get query parameters
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
         threshold = float(request.args.get('threshold', 10.0))
         
-        # Set default dates if not provided
-        if not start_date_str:
-            start_date = datetime(2000, 1, 1)
-        else:
-            start_date = datetime.fromisoformat(start_date_str)
-            
-        if not end_date_str:
-            end_date = datetime.now()
-        else:
-            end_date = datetime.fromisoformat(end_date_str)
+        # Reject malformed dates with a 400 before any expensive work
+        start_date, end_date, error = parse_date_range()
+        if error is not None:
+            return error
         
         # Get geomagnetic events
-        events = correlator.paleomag_database.get_field_weaknesses(start_date, end_date, threshold)
+        events = _cached(
+            ('geomagnetic', start_date, end_date, threshold),
+            lambda: correlator.paleomag_database.get_field_weaknesses(start_date, end_date, threshold)
+        )
         
         # Format events for JSON response
         formatted_events = []
         for event in events:
             formatted_events.append({
-                'timestamp': event.timestamp.isoformat(),
+                'timestamp': event.timestamp,
                 'magnitude': event.magnitude,
                 'duration_days': event.duration.days,
                 'description': event.description
             })
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': formatted_events,
             'count': len(formatted_events),
             'message': f"Retrieved {len(formatted_events)} geomagnetic events"
         })
     
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e),
+            'message': "Failed to retrieve geomagnetic events"
+        }, 400)
     except Exception as e:
-        logger.error(f"Error retrieving geomagnetic events: {str(e)}")
-        return jsonify({
+        logger.exception("Error retrieving geomagnetic events")
+        return _json({
             'success': False,
             'error': str(e),
             'message': "Failed to retrieve geomagnetic events"
-        }), 500
+        }, 500)
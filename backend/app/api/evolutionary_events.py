@@ -1,13 +1,26 @@
-from flask import jsonify, request
+from flask import request
 from app.api import api_bp
-from app.core.cosmic_evolution_correlator import CosmicEvolutionCorrelator
-from datetime import datetime
+from app.api._serialization import _cached, _json, _json_default, _ndjson, _respond
+from app.api.correlations import get_correlator, parse_date_range
+from app.core.cosmic_evolution_correlator import EvolutionaryEvent
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Initialize the correlator
-correlator = CosmicEvolutionCorrelator()
+def _event_default(obj):
+    """Shape a raw event for the JSON payload without an intermediate dict list"""
+    if isinstance(obj, EvolutionaryEvent):
+        return {'timestamp': obj.timestamp, 'type': obj.event_type,
+                'magnitude': obj.magnitude, 'affected_taxa': obj.affected_taxa,
+                'description': obj.description}
+    return _json_default(obj)
+
+def _bucket_by_type(events):
+    """Group events by type once so per-request filtering is a dict lookup"""
+    bucketed = {'_all': events}
+    for event in events:
+        bucketed.setdefault(event.event_type, []).append(event)
+    return bucketed
 
 @api_bp.route('/evolutionary-events', methods=['GET'])
 def get_evolutionary_events():
@@ -19,54 +32,49 @@ def get_evolutionary_events():
     - event_type: Type of event (speciation, extinction, all)
     """
     try:
+        correlator = get_correlator()
+
         # Get query parameters
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
         event_type = request.args.get('event_type', 'all')
         
-        # Set default dates if not provided
-        if not start_date_str:
-            start_date = datetime(2000, 1, 1)
-        else:
-            start_date = datetime.fromisoformat(start_date_str)
-            
-        if not end_date_str:
-            end_date = datetime.now()
-        else:
-            end_date = datetime.fromisoformat(end_date_str)
-        
-        # Get evolutionary events
-        events = correlator.fossil_parser.identify_radiations(start_date, end_date)
-        
-        # Filter by event type if specified
-        if event_type != 'all':
-            events = [event for event in events if event.event_type == event_type]
+        # Reject malformed dates with a 400 before any expensive work
+        start_date, end_date, error = parse_date_range()
+        if error is not None:
+            return error
         
-        # Format events for JSON response
-        formatted_events = []
-        for event in events:
-            formatted_events.append({
-                'timestamp': event.timestamp.isoformat(),
-                'type': event.event_type,
-                'magnitude': event.magnitude,
-                'affected_taxa': event.affected_taxa,
-                'description': event.description
-            })
+        # Get evolutionary events, pre-grouped by type in the cache entry
+        bucketed = _cached(
+            ('radiations', start_date, end_date),
+            lambda: _bucket_by_type(correlator.fossil_parser.identify_radiations(start_date, end_date))
+        )
+        events = bucketed['_all'] if event_type == 'all' else bucketed.get(event_type, [])
         
-        return jsonify({
+        # Stream one event per line when requested, keeping response memory flat
+        if request.args.get('stream') == '1':
+            return _ndjson(events, _event_default)
+
+        # Events are serialized in place via _event_default, with no
+        # intermediate dict list
+        return _respond({
             'success': True,
-            'data': formatted_events,
-            'count': len(formatted_events),
-            'message': f"Retrieved {len(formatted_events)} evolutionary events"
-        })
+            'data': events,
+            'count': len(events),
+            'message': f"Retrieved {len(events)} evolutionary events"
+        }, default=_event_default)
     
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e),
+            'message': "Failed to retrieve evolutionary events"
+        }, 400)
     except Exception as e:
-        logger.error(f"Error retrieving evolutionary events: {str(e)}")
-        return jsonify({
+        logger.exception("Error retrieving evolutionary events")
+        return _json({
             'success': False,
             'error': str(e),
             'message': "Failed to retrieve evolutionary events"
-        }), 500
+        }, 500)
 
 @api_bp.route('/evolutionary-events/speciation', methods=['GET'])
 def get_speciation_events():
@@ -74,51 +82,50 @@ def get_speciation_events():
     Endpoint specifically for speciation events
     """
     try:
-        # Get query parameters
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
-        
-        # Set default dates if not provided
-        if not start_date_str:
-            start_date = datetime(2000, 1, 1)
-        else:
-            start_date = datetime.fromisoformat(start_date_str)
-            
-        if not end_date_str:
-            end_date = datetime.now()
-        else:
-            end_date = datetime.fromisoformat(end_date_str)
-        
-        # Get evolutionary events
-        events = correlator.fossil_parser.identify_radiations(start_date, end_date)
+        correlator = get_correlator()
+
+        # Reject malformed dates with a 400 before any expensive work
+        start_date, end_date, error = parse_date_range()
+        if error is not None:
+            return error
         
-        # Filter for speciation events only
-        speciation_events = [event for event in events if event.event_type == 'speciation']
+        # Get evolutionary events, pre-grouped by type in the cache entry
+        bucketed = _cached(
+            ('radiations', start_date, end_date),
+            lambda: _bucket_by_type(correlator.fossil_parser.identify_radiations(start_date, end_date))
+        )
+        speciation_events = bucketed.get('speciation', [])
         
         # Format events for JSON response
         formatted_events = []
         for event in speciation_events:
             formatted_events.append({
-                'timestamp': event.timestamp.isoformat(),
+                'timestamp': event.timestamp,
                 'magnitude': event.magnitude,
                 'affected_taxa': event.affected_taxa,
                 'description': event.description
             })
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': formatted_events,
             'count': len(formatted_events),
             'message': f"Retrieved {len(formatted_events)} speciation events"
         })
     
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e),
+            'message': "Failed to retrieve speciation events"
+        }, 400)
     except Exception as e:
-        logger.error(f"Error retrieving speciation events: {str(e)}")
-        return jsonify({
+        logger.exception("Error retrieving speciation events")
+        return _json({
             'success': False,
             'error': str(e),
             'message': "Failed to retrieve speciation events"
-        }), 500
+        }, 500)
 
 @api_bp.route('/evolutionary-events/extinction', methods=['GET'])
 def get_extinction_events():
@@ -126,48 +133,47 @@ def get_extinction_events():
     Endpoint specifically for extinction events
     """
     try:
-        # Get query parameters
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
-        
-        # Set default dates if not provided
-        if not start_date_str:
-            start_date = datetime(2000, 1, 1)
-        else:
-            start_date = datetime.fromisoformat(start_date_str)
-            
-        if not end_date_str:
-            end_date = datetime.now()
-        else:
-            end_date = datetime.fromisoformat(end_date_str)
-        
-        # Get evolutionary events
-        events = correlator.fossil_parser.identify_radiations(start_date, end_date)
+        correlator = get_correlator()
+
+        # Reject malformed dates with a 400 before any expensive work
+        start_date, end_date, error = parse_date_range()
+        if error is not None:
+            return error
         
-        # Filter for extinction events only
-        extinction_events = [event for event in events if event.event_type == 'extinction']
+        # Get evolutionary events, pre-grouped by type in the cache entry
+        bucketed = _cached(
+            ('radiations', start_date, end_date),
+            lambda: _bucket_by_type(correlator.fossil_parser.identify_radiations(start_date, end_date))
+        )
+        extinction_events = bucketed.get('extinction', [])
         
         # Format events for JSON response
         formatted_events = []
         for event in extinction_events:
             formatted_events.append({
-                'timestamp': event.timestamp.isoformat(),
+                'timestamp': event.timestamp,
                 'magnitude': event.magnitude,
                 'affected_taxa': event.affected_taxa,
                 'description': event.description
             })
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': formatted_events,
             'count': len(formatted_events),
             'message': f"Retrieved {len(formatted_events)} extinction events"
         })
     
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e),
+            'message': "Failed to retrieve extinction events"
+        }, 400)
     except Exception as e:
-        logger.error(f"Error retrieving extinction events: {str(e)}")
-        return jsonify({
+        logger.exception("Error retrieving extinction events")
+        return _json({
             'success': False,
             'error': str(e),
             'message': "Failed to retrieve extinction events"
-        }), 500
+        }, 500)
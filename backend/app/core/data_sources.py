@@ -18,7 +18,12 @@ class JPLHorizonsAPI:
         self.base_url = "https://ssd.jpl.nasa.gov/api/horizons.api"
         self.cache_dir = cache_dir or os.path.join(os.path.dirname(__file__), '../../data/cache')
         os.makedirs(self.cache_dir, exist_ok=True)
-        
+        # One keep-alive session for all requests: repeated fetches reuse the
+        # TCP/TLS connection instead of paying a handshake per planet, and
+        # gzip shrinks the large ephemeris text payloads on the wire
+        self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = 'gzip'
+
     def get_planet_positions(self, planet_id: str, start_date: datetime, 
                             end_date: datetime, step: str = '1d') -> pd.DataFrame:
         """
@@ -61,7 +66,7 @@ class JPLHorizonsAPI:
         
         try:
             logger.info(f"Fetching data for planet {planet_id} from JPL Horizons")
-            response = requests.get(self.base_url, params=params)
+            response = self.session.get(self.base_url, params=params)
             response.raise_for_status()
             
             data = response.json()
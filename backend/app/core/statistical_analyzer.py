@@ -1,15 +1,45 @@
 import numpy as np
 import pandas as pd
 from scipy import stats
-from scipy.signal import find_peaks
-from sklearn.cluster import DBSCAN
-from sklearn.preprocessing import StandardScaler
+from scipy.signal import fftconvolve, find_peaks
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional, Union
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _lag_dot(x, y, lags):
+    """Direct sum(x[lag+i]*y[i]) per lag; one BLAS dot per lag without Numba"""
+    out = np.empty(len(lags))
+    n = len(x)
+    for k, lag in enumerate(lags):
+        out[k] = np.dot(x[lag:], y[:n - lag])
+    return out
+
+@functools.lru_cache(maxsize=1)
+def _lag_dot_kernel():
+    """JIT-compile the direct lag kernel on first use, if Numba is available"""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        logger.warning("Numba not installed, using the NumPy lag kernel")
+        return _lag_dot
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ucorr(x, y, lags):
+        out = np.empty(len(lags))
+        n = len(x)
+        for k in prange(len(lags)):
+            lag = lags[k]
+            acc = 0.0
+            for i in range(n - lag):
+                acc += x[i + lag] * y[i]
+            out[k] = acc
+        return out
+
+    return _ucorr
+
 class StatisticalAnalyzer:
     """
     Performs statistical analyses for cosmic-evolutionary correlations
@@ -34,43 +64,69 @@ class StatisticalAnalyzer:
         """
         # Ensure both series have the same time index
         common_index = cosmic_series.index.intersection(evolutionary_series.index)
-        cosmic_aligned = cosmic_series.loc[common_index]
-        evolutionary_aligned = evolutionary_series.loc[common_index]
-        
-        # Calculate cross-correlation for different lags
+        x = cosmic_series.loc[common_index].to_numpy(dtype=np.float64)
+        y = evolutionary_series.loc[common_index].to_numpy(dtype=np.float64)
+        n = len(x)
+
+        lags = np.arange(0, max_lag + 1, 30)  # Every 30 days
+        lags = lags[lags < n]
+        if lags.size == 0:
+            return []
+
+        # sum(x[lag+i]*y[i]) for every lag at once; the remaining per-lag
+        # moments come from prefix/suffix cumsums and Pearson r falls out of
+        # the algebraic identity
+        # r = (m·Sxy - Sx·Sy) / sqrt((m·Sxx - Sx²)(m·Syy - Sy²)).
+        # When the lag window is tiny relative to the series (as in the
+        # Cambrian script, max_lag=50 on long series) a handful of direct dot
+        # products beats the full O(N log N) FFT, so dispatch on the ratio.
+        if max_lag * 50 < n:
+            sum_xy = _lag_dot_kernel()(x, y, lags)
+        else:
+            sum_xy = fftconvolve(x, y[::-1], mode='full')[n - 1 + lags]
+        cum_x, cum_x2 = np.cumsum(x), np.cumsum(x * x)
+        cum_y, cum_y2 = np.cumsum(y), np.cumsum(y * y)
+
+        m = n - lags  # Overlap length at each lag
+        sum_x = cum_x[-1] - np.where(lags > 0, cum_x[lags - 1], 0.0)
+        sum_x2 = cum_x2[-1] - np.where(lags > 0, cum_x2[lags - 1], 0.0)
+        sum_y = cum_y[m - 1]
+        sum_y2 = cum_y2[m - 1]
+
+        var_x = m * sum_x2 - sum_x ** 2
+        var_y = m * sum_y2 - sum_y ** 2
+        valid = (m > 1) & (var_x > 0) & (var_y > 0)
+        if not valid.any():
+            return []
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = (m * sum_xy - sum_x * sum_y) / np.sqrt(var_x * var_y)
+        corr = np.clip(corr, -1.0, 1.0)
+
+        # Two-sided p-values from the exact t-distribution of r, vectorized
+        # over lags; overlaps too short for the test keep the degenerate p=1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = corr * np.sqrt((m - 2) / np.maximum(1.0 - corr ** 2, 1e-300))
+        p_values = np.where(m > 2, 2 * stats.t.sf(np.abs(t_stat), np.maximum(m - 2, 1)), 1.0)
+
+        # Fisher z confidence intervals (95%), also in one vectorized pass
+        safe_corr = np.where(np.abs(corr) < 1.0, corr, 0.0)
+        se = 1 / np.sqrt(np.maximum(m - 3, 1))
+        z = np.arctanh(safe_corr)
+        ci_low = np.tanh(z - 1.96 * se)
+        ci_high = np.tanh(z + 1.96 * se)
+
         correlations = []
-        
-        for lag in range(0, max_lag + 1, 30):  # Every 30 days
-            if lag >= len(cosmic_aligned):
-                continue
-                
-            # Shift the cosmic series
-            shifted_cosmic = cosmic_aligned.iloc[lag:]
-            aligned_evolutionary = evolutionary_aligned.iloc[:len(shifted_cosmic)]
-            
-            # Calculate correlation
-            if len(shifted_cosmic) > 0 and np.std(shifted_cosmic) > 0 and np.std(aligned_evolutionary) > 0:
-                corr, p_value = stats.pearsonr(shifted_cosmic, aligned_evolutionary)
-                
-                # Calculate confidence interval (95%)
-                n = len(shifted_cosmic)
-                if n > 3:
-                    se = 1 / np.sqrt(n - 3)
-                    z = np.arctanh(corr)
-                    ci_low = np.tanh(z - 1.96 * se)
-                    ci_high = np.tanh(z + 1.96 * se)
-                    confidence_interval = (ci_low, ci_high)
-                else:
-                    confidence_interval = (0, 0)
-                
-                correlations.append({
-                    'lag_days': lag,
-                    'correlation_coefficient': corr,
-                    'p_value': p_value,
-                    'confidence_interval': confidence_interval,
-                    'significant': p_value < 0.05
-                })
-        
+        for i in np.flatnonzero(valid):
+            confidence_interval = (float(ci_low[i]), float(ci_high[i])) if m[i] > 3 else (0, 0)
+            correlations.append({
+                'lag_days': int(lags[i]),
+                'correlation_coefficient': float(corr[i]),
+                'p_value': float(p_values[i]),
+                'confidence_interval': confidence_interval,
+                'significant': bool(p_values[i] < 0.05)
+            })
+
         return correlations
     
     def time_series_clustering(self, events_df: pd.DataFrame, eps: float = 30, 
@@ -88,24 +144,50 @@ class StatisticalAnalyzer:
         """
         # Extract timestamps and convert to numeric values
         timestamps = events_df['timestamp'].astype(np.int64) // 10**9  # Convert to seconds
-        
-        # Reshape for clustering
-        X = timestamps.values.reshape(-1, 1)
-        
+
         # Standardize the data
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-        
-        # Apply DBSCAN
-        clustering = DBSCAN(eps=eps, min_samples=min_samples).fit(X_scaled)
-        
+        X = timestamps.to_numpy(dtype=np.float64)
+        std = X.std()
+        X = (X - X.mean()) / (std if std > 0 else 1.0)
+
+        # DBSCAN on a single dimension reduces to a sorted sweep: a point is a
+        # core point when its eps-window holds min_samples points (counted with
+        # two searchsorted calls), and clusters are runs of core points whose
+        # consecutive gaps stay within eps. This is O(N log N) in NumPy instead
+        # of the generic O(N^2) neighborhood search.
+        order = np.argsort(X, kind='stable')
+        s = X[order]
+        n_neighbors = (np.searchsorted(s, s + eps, side='right')
+                       - np.searchsorted(s, s - eps, side='left'))
+        core = n_neighbors >= min_samples
+
+        sorted_labels = np.full(len(s), -1, dtype=np.int64)
+        if core.any():
+            core_vals = s[core]
+            core_labels = np.cumsum(np.r_[True, np.diff(core_vals) > eps]) - 1
+            sorted_labels[core] = core_labels
+
+            # Border points join the cluster of their nearest core point
+            noncore = np.flatnonzero(~core)
+            if noncore.size:
+                pos = np.searchsorted(core_vals, s[noncore])
+                lo = np.clip(pos - 1, 0, len(core_vals) - 1)
+                hi = np.clip(pos, 0, len(core_vals) - 1)
+                take_lo = np.abs(s[noncore] - core_vals[lo]) <= np.abs(s[noncore] - core_vals[hi])
+                nearest = np.where(take_lo, lo, hi)
+                reachable = np.abs(s[noncore] - core_vals[nearest]) <= eps
+                sorted_labels[noncore[reachable]] = core_labels[nearest[reachable]]
+
+        labels = np.empty(len(s), dtype=np.int64)
+        labels[order] = sorted_labels
+
         # Add cluster labels to the original dataframe
         events_df = events_df.copy()
-        events_df['cluster'] = clustering.labels_
+        events_df['cluster'] = labels
         
         # Group by cluster
         clusters = {}
-        for cluster_id in np.unique(clustering.labels_):
+        for cluster_id in np.unique(labels):
             if cluster_id == -1:  # Noise points
                 continue
                 
@@ -82,6 +82,33 @@ class DataProcessor:
         # Create time series
         return df[value_col]
     
+    @staticmethod
+    def find_peaks(series: pd.Series, height: Optional[float] = None,
+                  distance: Optional[int] = None) -> List[Dict]:
+        """
+        Find peaks in a time series
+
+        Args:
+            series: Time series to analyze
+            height: Minimum height of peaks
+            distance: Minimum distance between peaks in samples
+
+        Returns:
+            List of dictionaries with peak information
+        """
+        # scipy's C peak finder does the scan in one pass over the array
+        from scipy.signal import find_peaks
+
+        peak_indices, properties = find_peaks(series.to_numpy(), height=height, distance=distance)
+
+        values = series.to_numpy()[peak_indices]
+        timestamps = series.index[peak_indices]
+
+        return [
+            {'index': int(idx), 'timestamp': timestamp, 'value': float(value)}
+            for idx, timestamp, value in zip(peak_indices, timestamps, values)
+        ]
+
     @staticmethod
     def detect_outliers(series: pd.Series, method: str = 'iqr', threshold: float = 1.5) -> pd.Series:
         """
@@ -122,8 +122,9 @@ class Visualizer:
         Returns:
             Base64 encoded image
         """
-        # Extract data
-        lags = [r['time_lag_days'] for r in correlation_results]
+        # Extract data (the correlator emits 'time_lag_days', the series
+        # analyzer 'lag_days')
+        lags = [r.get('time_lag_days', r.get('lag_days')) for r in correlation_results]
         correlations = [r['correlation_coefficient'] for r in correlation_results]
         p_values = [r['p_value'] for r in correlation_results]
         significant = [r['significant'] for r in correlation_results]
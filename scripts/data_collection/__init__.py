@@ -8,6 +8,7 @@ import argparse
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Add the backend directory to the Python path
@@ -34,13 +35,14 @@ PLANET_IDS = {
     'neptune': '899'
 }
 
-def fetch_planet_data(planet_name, start_date, end_date, output_dir):
+def fetch_planet_data(planet_name, start_date, end_date, output_dir, api=None):
     """
     Fetch ephemeris data for a single planet and save it to a CSV file.
     """
     logger.info(f"Fetching data for {planet_name} from {start_date} to {end_date}")
-    
-    api = JPLHorizonsAPI(cache_dir=output_dir)
+
+    if api is None:
+        api = JPLHorizonsAPI(cache_dir=output_dir)
     planet_id = PLANET_IDS.get(planet_name.lower())
     
     if not planet_id:
@@ -87,12 +89,18 @@ def main():
     # Create output directory if it doesn't exist
     os.makedirs(args.output_dir, exist_ok=True)
     
-    # Fetch data for each planet
-    success_count = 0
-    for planet in args.planets:
-        if fetch_planet_data(planet, start_date, end_date, args.output_dir):
-            success_count += 1
-    
+    # Fetch all planets concurrently: each fetch is a network-bound Horizons
+    # request, so a thread per planet gives near-linear wall-clock speedup.
+    # The threads share one API instance, whose keep-alive session pools
+    # connections instead of opening a fresh one per planet
+    api = JPLHorizonsAPI(cache_dir=args.output_dir)
+    with ThreadPoolExecutor(max_workers=len(args.planets)) as executor:
+        results = list(executor.map(
+            lambda planet: fetch_planet_data(planet, start_date, end_date, args.output_dir, api),
+            args.planets
+        ))
+    success_count = sum(results)
+
     logger.info(f"Successfully fetched data for {success_count}/{len(args.planets)} planets.")
 
 if __name__ == '__main__':
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Add the backend directory to the Python path so tests can import the app
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
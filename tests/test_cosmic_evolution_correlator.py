@@ -3,11 +3,14 @@ from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
 from app.core.cosmic_evolution_correlator import (
-    CosmicEvolutionCorrelator, 
+    CosmicEvolutionCorrelator,
     PlanetaryTidalForceEngine,
     GeomagneticHistoryAPI,
     PaleontologicalRecordParser,
-    MolecularDivergenceTimer
+    MolecularDivergenceTimer,
+    CosmicEvent,
+    EvolutionaryEvent,
+    StatisticalAnalyzer
 )
 
 class TestCosmicEvolutionCorrelator(unittest.TestCase):
@@ -106,4 +109,120 @@ class TestGeomagneticHistoryAPI(unittest.TestCase):
         Set up test fixtures
         """
         self.api = GeomagneticHistoryAPI()
-        self.start_date = datetime(202
+        self.start_date = datetime(2020, 1, 1)
+        self.end_date = datetime(2020, 12, 31)
+
+    def test_get_field_weaknesses(self):
+        """
+        Test the get_field_weaknesses method
+        """
+        weaknesses = self.api.get_field_weaknesses(self.start_date, self.end_date)
+
+        # Check that weaknesses is a list
+        self.assertIsInstance(weaknesses, list)
+
+        # Check that each weakness has the expected attributes
+        for weakness in weaknesses:
+            self.assertTrue(hasattr(weakness, 'timestamp'))
+            self.assertTrue(hasattr(weakness, 'event_type'))
+            self.assertTrue(hasattr(weakness, 'magnitude'))
+            self.assertTrue(hasattr(weakness, 'duration'))
+            self.assertEqual(weakness.event_type, 'geomagnetic_weakness')
+
+class TestPaleontologicalRecordParser(unittest.TestCase):
+    """
+    Test cases for the PaleontologicalRecordParser class
+    """
+
+    def setUp(self):
+        """
+        Set up test fixtures
+        """
+        self.parser = PaleontologicalRecordParser()
+        self.start_date = datetime(2020, 1, 1)
+        self.end_date = datetime(2020, 12, 31)
+
+    def test_identify_radiations(self):
+        """
+        Test the identify_radiations method
+        """
+        events = self.parser.identify_radiations(self.start_date, self.end_date)
+
+        # Check that events is a list
+        self.assertIsInstance(events, list)
+
+        # Check that each event has the expected attributes
+        for event in events:
+            self.assertTrue(hasattr(event, 'timestamp'))
+            self.assertTrue(hasattr(event, 'event_type'))
+            self.assertTrue(hasattr(event, 'magnitude'))
+            self.assertTrue(hasattr(event, 'affected_taxa'))
+            self.assertIn(event.event_type, ['speciation', 'extinction'])
+
+class TestStatisticalAnalyzer(unittest.TestCase):
+    """
+    Test cases for the StatisticalAnalyzer class
+    """
+
+    def setUp(self):
+        """
+        Set up test fixtures
+        """
+        self.analyzer = StatisticalAnalyzer()
+
+    def test_cross_correlation_two_sample_overlap(self):
+        """
+        Test that lags whose overlap is only 2 samples get the degenerate
+        p-value of 1.0 instead of NaN (the t test has zero degrees of freedom)
+        """
+        # Events spanning 32 days: at lag 30 the overlap is exactly 2 samples
+        cosmic_events = [
+            CosmicEvent(datetime(2020, 1, 1) + timedelta(days=day), 'ftrt_peak',
+                        float(day + 1), timedelta(days=1), 'test peak')
+            for day in range(32)
+        ]
+        evolutionary_events = [
+            EvolutionaryEvent(datetime(2020, 1, 1) + timedelta(days=day), 'speciation',
+                              float(32 - day), ['Taxus_0'], 'test event')
+            for day in range(32)
+        ]
+
+        results = self.analyzer.cross_correlation(cosmic_events, evolutionary_events,
+                                                  max_lag_days=30)
+
+        lags = [result.time_lag.days for result in results]
+        self.assertIn(30, lags)
+        for result in results:
+            self.assertFalse(np.isnan(result.p_value))
+            self.assertTrue(0.0 <= result.p_value <= 1.0)
+            if result.time_lag.days == 30:
+                self.assertEqual(result.p_value, 1.0)
+
+class TestMolecularDivergenceTimer(unittest.TestCase):
+    """
+    Test cases for the MolecularDivergenceTimer class
+    """
+
+    def setUp(self):
+        """
+        Set up test fixtures
+        """
+        self.timer = MolecularDivergenceTimer()
+
+    def test_estimate_divergence_times(self):
+        """
+        Test the estimate_divergence_times method
+        """
+        taxa = ['Taxus_0', 'Taxus_1', 'Taxus_2']
+        divergence_times = self.timer.estimate_divergence_times(taxa)
+
+        # Check that divergence times is a dict
+        self.assertIsInstance(divergence_times, dict)
+
+        # Check that each taxon has a divergence time
+        for taxon in taxa:
+            self.assertIn(taxon, divergence_times)
+            self.assertIsInstance(divergence_times[taxon], datetime)
+
+if __name__ == '__main__':
+    unittest.main()